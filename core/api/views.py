@@ -339,21 +339,7 @@ def generate_title_suggestions(request: HttpRequest, data: GenerateTitleSuggesti
 
     for suggestion in suggestions:
         # Add keyword usage info to each suggestion
-        suggestion.keywords_with_usage = []
-        if suggestion.target_keywords:
-            for keyword_text in suggestion.target_keywords:
-                keyword_info = project_keywords.get(
-                    keyword_text.lower(),
-                    {"keyword": None, "in_use": False, "project_keyword_id": None},
-                )
-                suggestion.keywords_with_usage.append(
-                    {
-                        "text": keyword_text,
-                        "keyword": keyword_info["keyword"],
-                        "in_use": keyword_info["in_use"],
-                        "project_keyword_id": keyword_info["project_keyword_id"],
-                    }
-                )
+        suggestion.keywords_with_usage = suggestion.get_keywords_with_usage(project_keywords)
 
         context = {
             "suggestion": suggestion,
@@ -407,21 +393,7 @@ def generate_title_from_idea(request: HttpRequest, data: GenerateTitleSuggestion
 
         # Add keyword usage info to the suggestion
         project_keywords = project.get_keywords()
-        suggestion.keywords_with_usage = []
-        if suggestion.target_keywords:
-            for keyword_text in suggestion.target_keywords:
-                keyword_info = project_keywords.get(
-                    keyword_text.lower(),
-                    {"keyword": None, "in_use": False, "project_keyword_id": None},
-                )
-                suggestion.keywords_with_usage.append(
-                    {
-                        "text": keyword_text,
-                        "keyword": keyword_info["keyword"],
-                        "in_use": keyword_info["in_use"],
-                        "project_keyword_id": keyword_info["project_keyword_id"],
-                    }
-                )
+        suggestion.keywords_with_usage = suggestion.get_keywords_with_usage(project_keywords)
 
         # Render HTML for the suggestion using the Django template
         context = {
@@ -50,3 +50,14 @@ PLACEHOLDER_BRACKET_PATTERNS = [
     r"\[.*?tbd.*?\]",
     r"\[.*?example.*?\]",
 ]
+
+BLOG_POST_PDF_CACHE_TIMEOUT = 60 * 60 * 24
+BLOG_POST_PDF_TASK_CACHE_TIMEOUT = 60 * 10
+
+STRIPE_PRICE_CACHE_TIMEOUT = 60 * 60
+STRIPE_PRODUCT_PK_CACHE_TIMEOUT = 60 * 60
+
+SUBSCRIBED_USER_COUNT_CACHE_KEY = "subscribed_user_count"
+SUBSCRIBED_USER_COUNT_CACHE_TIMEOUT = 60 * 5
+
+PROJECT_KEYWORDS_CACHE_TIMEOUT = 60 * 60
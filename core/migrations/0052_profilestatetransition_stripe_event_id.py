@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0051_alter_project_url_and_add_profile_url_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="profilestatetransition",
+            name="stripe_event_id",
+            field=models.CharField(blank=True, max_length=255, null=True, unique=True),
+        ),
+    ]
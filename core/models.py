@@ -1,3 +1,4 @@
+from collections import namedtuple
 from decimal import Decimal, InvalidOperation
 from urllib.request import urlopen
 
@@ -5,8 +6,10 @@ import replicate
 import requests
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import caches
 from django.core.files.base import ContentFile
 from django.db import models, transaction
+from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.text import slugify
@@ -54,11 +57,13 @@ from core.choices import (
     ProjectStyle,
     ProjectType,
 )
+from core.constants import PROJECT_KEYWORDS_CACHE_TIMEOUT, SUBSCRIBED_USER_COUNT_CACHE_KEY
 from core.utils import (
     generate_random_key,
     get_jina_embedding,
     get_markdown_content,
     get_og_image_prompt,
+    get_project_keywords_cache_key,
     get_relevant_external_pages_for_blog_post,
     get_relevant_pages_for_blog_post,
     process_generated_blog_content,
@@ -68,6 +73,11 @@ from tuxseo.utils import get_tuxseo_logger
 
 logger = get_tuxseo_logger(__name__)
 
+KeywordUsage = namedtuple("KeywordUsage", "text keyword in_use project_keyword_id")
+
+# Shared read-only fallback for target keywords that are not project keywords
+_MISSING_KEYWORD = {"keyword": None, "in_use": False, "project_keyword_id": None}
+
 
 class Profile(BaseModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
@@ -120,6 +130,42 @@ class Profile(BaseModel):
             group="Track State Change",
         )
 
+    def record_state_change(
+        self, from_state, to_state, metadata=None, update_fields=(), stripe_event_id=None
+    ):
+        """
+        Write a state transition and save it with any other changed fields in one UPDATE.
+
+        Used by worker code; request paths should go through `track_state_change`.
+        """
+        update_fields = list(update_fields)
+
+        if from_state != to_state:
+            # Stripe delivers webhooks at least once; the unique event id drops redelivered rows
+            ProfileStateTransition.objects.bulk_create(
+                [
+                    ProfileStateTransition(
+                        profile=self,
+                        from_state=from_state,
+                        to_state=to_state,
+                        backup_profile_id=self.id,
+                        metadata=metadata,
+                        stripe_event_id=stripe_event_id,
+                    )
+                ],
+                ignore_conflicts=True,
+            )
+            self.state = to_state
+            update_fields.append("state")
+
+            if ProfileStates.SUBSCRIBED in (from_state, to_state):
+                transaction.on_commit(
+                    lambda: caches["shared"].delete(SUBSCRIBED_USER_COUNT_CACHE_KEY)
+                )
+
+        if update_fields:
+            self.save(update_fields=update_fields)
+
     @property
     def current_state(self):
         if not self.state_transitions.all().exists():
@@ -361,6 +407,7 @@ class ProfileStateTransition(BaseModel):
     to_state = models.CharField(max_length=255, choices=ProfileStates.choices)
     backup_profile_id = models.IntegerField()
     metadata = models.JSONField(null=True, blank=True)
+    stripe_event_id = models.CharField(max_length=255, unique=True, null=True, blank=True)
 
 
 class BlogPost(BaseModel):
@@ -717,7 +764,17 @@ class Project(BaseModel):
                 "project_keyword_id": int
             }
         }
+
+        The result is cached per project in the shared cache (keyword writes mostly happen
+        on workers) and cleared by signals whenever a project keyword or one of its
+        keywords is saved or deleted.
         """
+        keywords_cache = caches["shared"]
+        cache_key = get_project_keywords_cache_key(self.id)
+        project_keywords = keywords_cache.get(cache_key)
+        if project_keywords is not None:
+            return project_keywords
+
         project_keywords = {}
         for project_keyword in self.project_keywords.select_related("keyword").all():
             project_keywords[project_keyword.keyword.keyword_text.lower()] = {
@@ -725,6 +782,8 @@ class Project(BaseModel):
                 "in_use": project_keyword.use,
                 "project_keyword_id": project_keyword.id,
             }
+
+        keywords_cache.set(cache_key, project_keywords, timeout=PROJECT_KEYWORDS_CACHE_TIMEOUT)
         return project_keywords
 
     class Meta:
@@ -789,6 +848,25 @@ class BlogPostTitleSuggestion(BaseModel):
             suggested_meta_description=self.suggested_meta_description,
         )
 
+    def get_keywords_with_usage(self, project_keywords: dict) -> list[KeywordUsage]:
+        """
+        Pair each target keyword with its project keyword info.
+
+        `project_keywords` is the lookup returned by `Project.get_keywords()`.
+        """
+        keywords_with_usage = []
+        for keyword_text in self.target_keywords or []:
+            keyword_info = project_keywords.get(keyword_text.lower(), _MISSING_KEYWORD)
+            keywords_with_usage.append(
+                KeywordUsage(
+                    keyword_text,
+                    keyword_info["keyword"],
+                    keyword_info["in_use"],
+                    keyword_info["project_keyword_id"],
+                )
+            )
+        return keywords_with_usage
+
     def get_internal_links(self, max_pages=2):
         manually_selected_project_pages = list(self.project.project_pages.filter(always_use=True))
         relevant_project_pages = list(
@@ -1102,6 +1180,28 @@ class GeneratedBlogPost(BaseModel):
         - Instead of using links as a reference, try to insert them into the post directly, organically.
         """  # noqa: E501
 
+    @property
+    def pdf_cache_key(self):
+        # updated_at moves on every save, so edits never serve a stale PDF
+        return f"gbp_pdf:{self.id}:{int(self.updated_at.timestamp())}"
+
+    @property
+    def pdf_task_cache_key(self):
+        return f"{self.pdf_cache_key}:task"
+
+    def render_pdf(self) -> bytes:
+        # Only the PDF worker needs WeasyPrint; importing it loads Pango and cairo
+        from weasyprint import HTML
+
+        html_content = render_to_string(
+            "blog/generated_blog_post_pdf.html",
+            {
+                "generated_post": self,
+                "project": self.project,
+            },
+        )
+        return HTML(string=html_content).write_pdf()
+
     @property
     def generated_blog_post_schema(self):
         return GeneratedBlogPostSchema(
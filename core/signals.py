@@ -1,12 +1,19 @@
 from allauth.account.signals import email_confirmed, user_signed_up
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save, pre_save
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django_q.tasks import async_task
+from djstripe.models import Price, Product
 
 from core.analytics import ANALYTICS_EVENTS
-from core.models import Profile, ProfileStates, Project
+from core.models import Keyword, Profile, ProfileStates, Project, ProjectKeyword
 from core.tasks import add_email_to_buttondown
+from core.utils import (
+    get_project_keywords_cache_key,
+    get_stripe_price_cache_key,
+    get_stripe_product_pk_cache_key,
+)
 from tuxseo.utils import get_tuxseo_logger
 
 logger = get_tuxseo_logger(__name__)
@@ -109,3 +116,34 @@ def parse_sitemap_on_save(sender, instance, created, **kwargs):
                 instance.id,
                 group="Parse Sitemap",
             )
+
+
+@receiver(post_save, sender=Price)
+def clear_cached_stripe_price(sender, instance, **kwargs):
+    if instance.product_id is None:
+        return
+
+    caches["shared"].delete(get_stripe_price_cache_key(instance.product.name, instance.livemode))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def clear_cached_product_djstripe_pk(sender, instance, **kwargs):
+    caches["shared"].delete(get_stripe_product_pk_cache_key(instance.id))
+
+
+@receiver(post_save, sender=ProjectKeyword)
+@receiver(post_delete, sender=ProjectKeyword)
+def clear_cached_project_keywords(sender, instance, **kwargs):
+    caches["shared"].delete(get_project_keywords_cache_key(instance.project_id))
+
+
+@receiver(post_save, sender=Keyword)
+def clear_cached_project_keywords_for_keyword(sender, instance, created, **kwargs):
+    if created:
+        return
+
+    project_ids = instance.keyword_projects.values_list("project_id", flat=True)
+    caches["shared"].delete_many(
+        [get_project_keywords_cache_key(project_id) for project_id in project_ids]
+    )
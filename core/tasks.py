@@ -5,6 +5,7 @@ from urllib.parse import unquote, urlencode
 import posthog
 import requests
 from django.conf import settings
+from django.core.cache import caches
 from django.utils import timezone
 from django_q.tasks import async_task
 
@@ -15,6 +16,7 @@ from core.analytics import (
     normalize_event_name,
 )
 from core.choices import ContentType, EmailType, ProjectPageSource
+from core.constants import BLOG_POST_PDF_CACHE_TIMEOUT
 from core.models import (
     BlogPostTitleSuggestion,
     Competitor,
@@ -632,7 +634,7 @@ def track_event(
     }
 
     try:
-        profile = Profile.objects.get(id=profile_id)
+        profile = Profile.objects.select_related("user").get(id=profile_id)
     except Profile.DoesNotExist:
         logger.error("[TrackEvent] Profile not found.", **base_log_data)
         return f"Profile with id {profile_id} not found."
@@ -675,7 +677,7 @@ def track_state_change(
     metadata: dict = None,
     source_function: str = None,
 ) -> None:
-    from core.models import Profile, ProfileStateTransition
+    from core.models import Profile
 
     base_log_data = {
         "profile_id": profile_id,
@@ -693,19 +695,28 @@ def track_state_change(
 
     if from_state != to_state:
         logger.info("[TrackStateChange] Tracking state change", **base_log_data)
-        ProfileStateTransition.objects.create(
-            profile=profile,
-            from_state=from_state,
-            to_state=to_state,
-            backup_profile_id=profile_id,
-            metadata=metadata,
-        )
-        profile.state = to_state
-        profile.save(update_fields=["state"])
+        profile.record_state_change(from_state, to_state, metadata=metadata)
 
     return f"Tracked state change from {from_state} to {to_state} for profile {profile_id}"
 
 
+def process_stripe_subscription_event(event_id: str, event_type: str, event_payload: dict) -> str:
+    from core.webhooks import SUBSCRIPTION_EVENT_PROCESSORS
+
+    processor = SUBSCRIPTION_EVENT_PROCESSORS.get(event_type)
+    if not processor:
+        logger.warning(
+            "[ProcessStripeSubscriptionEvent] Unsupported event type",
+            event_id=event_id,
+            event_type=event_type,
+        )
+        return f"Unsupported Stripe event type: {event_type}"
+
+    processor(event_id, event_payload)
+
+    return f"Processed Stripe event {event_id} ({event_type})"
+
+
 def generate_and_post_blog_post(project_id: int):
     project = Project.objects.get(id=project_id)
     profile = project.profile
@@ -1318,6 +1329,38 @@ def generate_og_image_for_blog_post(blog_post_id: int):
     return message
 
 
+def generate_blog_post_pdf(generated_post_id: int):
+    """
+    Render a generated blog post to PDF.
+    WeasyPrint can take several seconds per document, so this runs on a worker and
+    stores the PDF in the shared cache for the download view to serve.
+    """
+    try:
+        generated_post = GeneratedBlogPost.objects.select_related("project").get(
+            id=generated_post_id
+        )
+    except GeneratedBlogPost.DoesNotExist:
+        logger.error(
+            "[GenerateBlogPostPDF] Blog post not found",
+            blog_post_id=generated_post_id,
+        )
+        return f"Blog post {generated_post_id} not found"
+
+    pdf_file = generated_post.render_pdf()
+    caches["shared"].set(
+        generated_post.pdf_cache_key, pdf_file, timeout=BLOG_POST_PDF_CACHE_TIMEOUT
+    )
+
+    logger.info(
+        "[GenerateBlogPostPDF] Rendered PDF",
+        blog_post_id=generated_post.id,
+        project_id=generated_post.project_id,
+        pdf_size_bytes=len(pdf_file),
+    )
+
+    return f"Rendered PDF for blog post {generated_post.id}"
+
+
 def track_email_sent(email_address: str, email_type: EmailType, profile: Profile = None):
     """
     Track sent emails by creating EmailSent records.
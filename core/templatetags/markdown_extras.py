@@ -66,6 +66,18 @@ def markdown(value):
     return mark_safe(str(soup))
 
 
+@register.filter
+@stringfilter
+def markdown_print(value):
+    """
+    Markdown for the PDF export.
+    Skips the copy button and hidden textarea that `markdown` wraps around code blocks,
+    since WeasyPrint has no stylesheet to hide them and would lay out every snippet twice.
+    """
+    md_instance = md.Markdown(extensions=["tables", "fenced_code"])
+    return mark_safe(md_instance.convert(value))
+
+
 @register.filter
 @stringfilter
 def replace_quotes(value):
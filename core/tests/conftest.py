@@ -4,10 +4,17 @@ from pathlib import Path
 
 import pytest
 from django.conf import settings
+from django.core.cache import caches
 
 
 def pytest_configure(config):
-    settings.STORAGES["staticfiles"]["BACKEND"] = "django.contrib.staticfiles.storage.StaticFilesStorage"
+    settings.STORAGES["staticfiles"]["BACKEND"] = (
+        "django.contrib.staticfiles.storage.StaticFilesStorage"
+    )
+    settings.CACHES["shared"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "shared",
+    }
 
     manifest_path = Path(tempfile.gettempdir()) / "tuxseo-test-webpack-manifest.json"
     manifest_path.write_text(
@@ -22,7 +29,7 @@ def pytest_configure(config):
                     }
                 },
                 "index.js": "/static/index.js",
-                "index.css": "/static/index.css"
+                "index.css": "/static/index.css",
             }
         ),
         encoding="utf-8",
@@ -42,3 +49,12 @@ def mock_async_task_calls(monkeypatch):
     monkeypatch.setattr("core.adapters.async_task", lambda *args, **kwargs: None)
     monkeypatch.setattr("core.scheduled_tasks.async_task", lambda *args, **kwargs: None)
 
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached lookups from leaking between tests."""
+    for cache_backend in caches.all():
+        cache_backend.clear()
+    yield
+    for cache_backend in caches.all():
+        cache_backend.clear()
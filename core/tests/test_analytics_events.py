@@ -58,7 +58,8 @@ def test_track_event_normalizes_deprecated_event_name_before_capture():
     fake_user = Mock(email="event-user@example.com")
     fake_profile = Mock(id=123, user=fake_user, state="active")
 
-    with patch("core.tasks.Profile.objects.get", return_value=fake_profile):
+    with patch("core.tasks.Profile.objects.select_related") as mock_select_related:
+        mock_select_related.return_value.get.return_value = fake_profile
         with patch("core.tasks.posthog.capture") as mock_capture:
             result = track_event(
                 profile_id=fake_profile.id,
@@ -80,7 +81,8 @@ def test_track_event_rejects_unknown_event_name():
     fake_user = Mock(email="event-user@example.com")
     fake_profile = Mock(id=123, user=fake_user, state="active")
 
-    with patch("core.tasks.Profile.objects.get", return_value=fake_profile):
+    with patch("core.tasks.Profile.objects.select_related") as mock_select_related:
+        mock_select_related.return_value.get.return_value = fake_profile
         with patch("core.tasks.posthog.capture") as mock_capture:
             result = track_event(
                 profile_id=fake_profile.id,
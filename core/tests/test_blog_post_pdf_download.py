@@ -0,0 +1,178 @@
+from types import SimpleNamespace
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+
+from core.models import GeneratedBlogPost, Project
+
+
+def create_generated_post(username: str) -> tuple:
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        password="secret",
+    )
+    project = Project.objects.create(
+        profile=user.profile,
+        url=f"https://{username}.example.com",
+        name="PDF Project",
+    )
+    generated_post = GeneratedBlogPost.objects.create(
+        project=project,
+        title="PDF Post",
+        slug="pdf-post",
+        tags="seo",
+        content="# PDF Post",
+    )
+    return user, project, generated_post
+
+
+def get_status_url(project, generated_post, task_id="task-123"):
+    return reverse(
+        "download_blog_post_pdf_status",
+        kwargs={"project_pk": project.id, "pk": generated_post.id, "task_id": task_id},
+    )
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_enqueues_task_and_redirects_to_status(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-enqueue-user")
+    client.force_login(user)
+    enqueued_calls = []
+
+    def fake_async_task(*args, **kwargs):
+        enqueued_calls.append((args, kwargs))
+        return "task-123"
+
+    monkeypatch.setattr("core.views.async_task", fake_async_task)
+
+    response = client.get(
+        reverse(
+            "download_blog_post_pdf",
+            kwargs={"project_pk": project.id, "pk": generated_post.id},
+        )
+    )
+
+    assert response.status_code == 302
+    assert response.url == get_status_url(project, generated_post)
+    assert enqueued_calls[0][0] == ("core.tasks.generate_blog_post_pdf", generated_post.id)
+    assert caches["shared"].get(generated_post.pdf_task_cache_key) == "task-123"
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_reuses_pending_task(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-pending-task-user")
+    client.force_login(user)
+    caches["shared"].set(generated_post.pdf_task_cache_key, "task-123")
+
+    def fail_async_task(*args, **kwargs):
+        raise AssertionError("PDF task should not be enqueued while one is pending")
+
+    monkeypatch.setattr("core.views.async_task", fail_async_task)
+
+    response = client.get(
+        reverse(
+            "download_blog_post_pdf",
+            kwargs={"project_pk": project.id, "pk": generated_post.id},
+        )
+    )
+
+    assert response.status_code == 302
+    assert response.url == get_status_url(project, generated_post)
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_status_shows_pending_page_while_task_runs(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-pending-user")
+    client.force_login(user)
+    monkeypatch.setattr("core.views.fetch", lambda task_id: None)
+
+    response = client.get(get_status_url(project, generated_post))
+
+    assert response.status_code == 200
+    assert "blog/generated_blog_post_pdf_pending.html" in [t.name for t in response.templates]
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_status_shows_ready_page_once_worker_rendered_pdf(
+    client, monkeypatch
+):
+    user, project, generated_post = create_generated_post("pdf-ready-user")
+    client.force_login(user)
+    caches["shared"].set(generated_post.pdf_cache_key, b"%PDF-1.7")
+
+    def fail_fetch(task_id):
+        raise AssertionError("Task should not be fetched once the PDF is cached")
+
+    monkeypatch.setattr("core.views.fetch", fail_fetch)
+
+    response = client.get(get_status_url(project, generated_post))
+
+    assert response.status_code == 200
+    assert response.context["pdf_ready"] is True
+    assert "blog/generated_blog_post_pdf_pending.html" in [t.name for t in response.templates]
+    assert (
+        reverse(
+            "download_blog_post_pdf",
+            kwargs={"project_pk": project.id, "pk": generated_post.id},
+        )
+        in response.content.decode()
+    )
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_status_requeues_when_finished_pdf_is_missing(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-missing-user")
+    client.force_login(user)
+    caches["shared"].set(generated_post.pdf_task_cache_key, "task-123")
+    finished_task = SimpleNamespace(success=True, args=(generated_post.id,), result="Rendered")
+    monkeypatch.setattr("core.views.fetch", lambda task_id: finished_task)
+
+    response = client.get(get_status_url(project, generated_post))
+
+    assert response.status_code == 302
+    assert response.url == reverse(
+        "download_blog_post_pdf",
+        kwargs={"project_pk": project.id, "pk": generated_post.id},
+    )
+    assert caches["shared"].get(generated_post.pdf_task_cache_key) is None
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_serves_cached_pdf_without_enqueuing(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-cached-user")
+    client.force_login(user)
+    caches["shared"].set(generated_post.pdf_cache_key, b"%PDF-cached")
+
+    def fail_async_task(*args, **kwargs):
+        raise AssertionError("PDF task should not be enqueued on a cache hit")
+
+    monkeypatch.setattr("core.views.async_task", fail_async_task)
+
+    response = client.get(
+        reverse(
+            "download_blog_post_pdf",
+            kwargs={"project_pk": project.id, "pk": generated_post.id},
+        )
+    )
+
+    assert response.status_code == 200
+    assert response.content == b"%PDF-cached"
+
+
+@pytest.mark.django_db
+def test_download_blog_post_pdf_status_rejects_task_for_another_post(client, monkeypatch):
+    user, project, generated_post = create_generated_post("pdf-other-task-user")
+    client.force_login(user)
+    other_task = SimpleNamespace(success=True, args=(generated_post.id + 1,), result="Rendered")
+    monkeypatch.setattr("core.views.fetch", lambda task_id: other_task)
+
+    response = client.get(get_status_url(project, generated_post))
+
+    assert response.status_code == 302
+    assert response.url == reverse(
+        "generated_blog_post_detail",
+        kwargs={"project_pk": project.id, "pk": generated_post.id},
+    )
@@ -0,0 +1,15 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from core import views
+
+
+def test_get_or_create_customer_for_profile_reuses_linked_customer():
+    customer = object()
+    profile = SimpleNamespace(customer_id="cus_123", customer=customer)
+
+    with patch.object(views.djstripe_models.Customer, "get_or_create") as mock_get_or_create:
+        result = views.get_or_create_customer_for_profile(profile)
+
+    assert result is customer
+    mock_get_or_create.assert_not_called()
@@ -1,7 +1,10 @@
+from pathlib import Path
+
 from django.test import override_settings
 
 from core.templatetags.markdown_extras import (
     markdown as markdown_filter,
+    markdown_print,
     mjml_configured,
     replace,
     replace_quotes,
@@ -38,6 +41,27 @@ class TestMarkdownFilter:
         assert 'rel="noopener noreferrer"' in rendered_html
 
 
+class TestMarkdownPrintFilter:
+    def test_renders_code_blocks_without_copy_controls(self):
+        markdown_text = '# Heading\n\n```bash\necho "hello"\n```'
+
+        rendered_html = markdown_print(markdown_text)
+
+        assert "<h1>Heading</h1>" in rendered_html
+        assert 'echo "hello"' in rendered_html
+        assert "<textarea" not in rendered_html
+        assert "<button" not in rendered_html
+
+    def test_pdf_template_is_self_contained(self):
+        content = Path("frontend/templates/blog/generated_blog_post_pdf.html").read_text(
+            encoding="utf-8"
+        )
+
+        assert "|markdown_print" in content
+        assert "<link" not in content
+        assert "{% extends" not in content
+
+
 class TestReplaceQuotesFilter:
     def test_replaces_double_quotes_with_single_quotes(self):
         text_with_quotes = 'Say "hello" to "world"'
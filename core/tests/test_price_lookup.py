@@ -36,3 +36,14 @@ def test_get_price_for_product_name_raises_when_price_is_missing():
 
         with pytest.raises(views.djstripe_models.Price.DoesNotExist):
             views.get_price_for_product_name("Pro - Yearly")
+
+
+def test_get_price_for_product_name_reuses_cached_price():
+    with patch.object(
+        views, "lookup_price_for_product_name", return_value="cached_price"
+    ) as mock_lookup:
+        first_result = views.get_price_for_product_name("Pro - Yearly")
+        second_result = views.get_price_for_product_name("Pro - Yearly")
+
+    assert first_result == second_result == "cached_price"
+    mock_lookup.assert_called_once_with("Pro - Yearly")
@@ -0,0 +1,70 @@
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import caches
+
+from core.choices import ProfileStates
+from core.constants import SUBSCRIBED_USER_COUNT_CACHE_KEY
+from core.models import ProfileStateTransition
+
+
+@pytest.mark.django_db
+def test_record_state_change_saves_state_with_other_fields(django_capture_on_commit_callbacks):
+    user = User.objects.create_user(
+        username="state-change-user",
+        email="state-change-user@example.com",
+        password="secret",
+    )
+    profile = user.profile
+    caches["shared"].set(SUBSCRIBED_USER_COUNT_CACHE_KEY, 3)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        profile.key = "newkey1234"
+        profile.record_state_change(
+            ProfileStates.SIGNED_UP,
+            ProfileStates.SUBSCRIBED,
+            metadata={"event": "subscription_created"},
+            update_fields=["key"],
+        )
+
+    profile.refresh_from_db()
+    assert profile.state == ProfileStates.SUBSCRIBED
+    assert profile.key == "newkey1234"
+    assert ProfileStateTransition.objects.filter(
+        profile=profile,
+        from_state=ProfileStates.SIGNED_UP,
+        to_state=ProfileStates.SUBSCRIBED,
+    ).exists()
+    assert caches["shared"].get(SUBSCRIBED_USER_COUNT_CACHE_KEY) is None
+
+
+@pytest.mark.django_db
+def test_record_state_change_skips_transition_when_state_is_unchanged():
+    user = User.objects.create_user(
+        username="state-unchanged-user",
+        email="state-unchanged-user@example.com",
+        password="secret",
+    )
+    profile = user.profile
+
+    profile.record_state_change(ProfileStates.SUBSCRIBED, ProfileStates.SUBSCRIBED)
+
+    assert not ProfileStateTransition.objects.filter(profile=profile).exists()
+
+
+@pytest.mark.django_db
+def test_record_state_change_ignores_redelivered_stripe_event():
+    user = User.objects.create_user(
+        username="state-redelivered-user",
+        email="state-redelivered-user@example.com",
+        password="secret",
+    )
+    profile = user.profile
+
+    for _ in range(2):
+        profile.record_state_change(
+            ProfileStates.SIGNED_UP,
+            ProfileStates.SUBSCRIBED,
+            stripe_event_id="evt_123",
+        )
+
+    assert ProfileStateTransition.objects.filter(stripe_event_id="evt_123").count() == 1
@@ -0,0 +1,37 @@
+import pytest
+from allauth.account.models import EmailAddress
+from django.contrib.auth.models import User
+
+from core.views import get_profile_with_email_address
+
+
+@pytest.mark.django_db
+def test_get_profile_with_email_address_matches_email_case_insensitively():
+    user = User.objects.create_user(
+        username="profile-email-user",
+        email="Profile-Email@example.com",
+        password="secret",
+    )
+    EmailAddress.objects.create(user=user, email="other@example.com", verified=False)
+    primary_address = EmailAddress.objects.create(
+        user=user, email="profile-email@example.com", verified=True
+    )
+
+    profile, email_address = get_profile_with_email_address(user)
+
+    assert email_address == primary_address
+    assert profile.user_id == user.id
+    assert user.profile is profile
+
+
+@pytest.mark.django_db
+def test_get_profile_with_email_address_returns_none_without_email_address():
+    user = User.objects.create_user(
+        username="profile-no-email-user",
+        email="profile-no-email@example.com",
+        password="secret",
+    )
+
+    _, email_address = get_profile_with_email_address(user)
+
+    assert email_address is None
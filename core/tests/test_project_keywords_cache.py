@@ -0,0 +1,48 @@
+import pytest
+from django.contrib.auth.models import User
+
+from core.models import Keyword, Project, ProjectKeyword
+
+
+def create_project_keyword(username: str) -> tuple:
+    user = User.objects.create_user(
+        username=username,
+        email=f"{username}@example.com",
+        password="secret",
+    )
+    project = Project.objects.create(
+        profile=user.profile,
+        url=f"https://{username}.example.com",
+        name="Keyword Project",
+    )
+    keyword = Keyword.objects.create(keyword_text="Django SEO")
+    project_keyword = ProjectKeyword.objects.create(project=project, keyword=keyword)
+    return project, keyword, project_keyword
+
+
+@pytest.mark.django_db
+def test_get_keywords_is_refreshed_when_project_keyword_changes():
+    project, _, project_keyword = create_project_keyword("keywords-cache-use-user")
+
+    assert project.get_keywords()["django seo"]["in_use"] is False
+
+    project_keyword.use = True
+    project_keyword.save(update_fields=["use"])
+
+    assert project.get_keywords()["django seo"]["in_use"] is True
+
+    project_keyword.delete()
+
+    assert project.get_keywords() == {}
+
+
+@pytest.mark.django_db
+def test_get_keywords_is_refreshed_when_keyword_metrics_change():
+    project, keyword, _ = create_project_keyword("keywords-cache-volume-user")
+
+    assert project.get_keywords()["django seo"]["keyword"].volume is None
+
+    keyword.volume = 1200
+    keyword.save(update_fields=["volume"])
+
+    assert project.get_keywords()["django seo"]["keyword"].volume == 1200
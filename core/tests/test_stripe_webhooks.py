@@ -0,0 +1,122 @@
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from core.choices import ProfileStates
+from core.models import ProfileStateTransition
+from core.tasks import process_stripe_subscription_event
+from core.webhooks import (
+    get_product_djstripe_pk,
+    handle_created_subscription,
+    process_deleted_subscription,
+    process_updated_subscription,
+)
+
+
+@pytest.mark.django_db
+def test_subscription_webhook_enqueues_serializable_event_payload(
+    django_capture_on_commit_callbacks,
+):
+    event_payload = {"object": {"id": "sub_123", "customer": "cus_123"}}
+    fake_event = SimpleNamespace(
+        id="evt_123",
+        type="customer.subscription.created",
+        data=event_payload,
+    )
+
+    with patch("core.webhooks.async_task") as mock_async_task:
+        with django_capture_on_commit_callbacks(execute=True):
+            handle_created_subscription(event=fake_event)
+
+    mock_async_task.assert_called_once_with(
+        "core.tasks.process_stripe_subscription_event",
+        "evt_123",
+        "customer.subscription.created",
+        event_payload,
+        group="Stripe Webhook",
+    )
+
+
+@pytest.mark.django_db
+def test_subscription_webhook_is_not_enqueued_when_event_transaction_rolls_back():
+    fake_event = SimpleNamespace(
+        id="evt_123",
+        type="customer.subscription.created",
+        data={"object": {"id": "sub_123", "customer": "cus_123"}},
+    )
+
+    with patch("core.webhooks.async_task") as mock_async_task:
+        with transaction.atomic():
+            handle_created_subscription(event=fake_event)
+            transaction.set_rollback(True)
+
+    mock_async_task.assert_not_called()
+
+
+def test_process_stripe_subscription_event_dispatches_to_processor():
+    processor = Mock()
+    event_payload = {"object": {"id": "sub_123"}}
+
+    with patch.dict(
+        "core.webhooks.SUBSCRIPTION_EVENT_PROCESSORS",
+        {"customer.subscription.deleted": processor},
+    ):
+        result = process_stripe_subscription_event(
+            "evt_123", "customer.subscription.deleted", event_payload
+        )
+
+    processor.assert_called_once_with("evt_123", event_payload)
+    assert "evt_123" in result
+
+
+def test_process_stripe_subscription_event_ignores_unknown_event_type():
+    result = process_stripe_subscription_event("evt_123", "invoice.paid", {})
+
+    assert result == "Unsupported Stripe event type: invoice.paid"
+
+
+def test_process_updated_subscription_skips_irrelevant_changes():
+    event_payload = {
+        "object": {"id": "sub_123", "customer": "cus_123"},
+        "previous_attributes": {"latest_invoice": "in_123"},
+    }
+
+    with patch("core.webhooks.get_profile_for_update") as mock_get_profile:
+        process_updated_subscription("evt_123", event_payload)
+
+    mock_get_profile.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_process_deleted_subscription_skips_redelivered_event():
+    user = User.objects.create_user(
+        username="redelivered-webhook-user",
+        email="redelivered-webhook-user@example.com",
+        password="secret",
+    )
+    ProfileStateTransition.objects.create(
+        profile=user.profile,
+        from_state=ProfileStates.SUBSCRIBED,
+        to_state=ProfileStates.CHURNED,
+        backup_profile_id=user.profile.id,
+        stripe_event_id="evt_123",
+    )
+    locked_profile = Mock()
+    event_payload = {"object": {"id": "sub_123", "customer": "cus_123"}}
+
+    with patch("core.webhooks.get_profile_for_update", return_value=locked_profile):
+        process_deleted_subscription("evt_123", event_payload)
+
+    locked_profile.record_state_change.assert_not_called()
+
+
+def test_get_product_djstripe_pk_reuses_cached_value():
+    with patch("core.webhooks.get_djstripe_pk", return_value=42) as mock_get_djstripe_pk:
+        first_pk = get_product_djstripe_pk("prod_123")
+        second_pk = get_product_djstripe_pk("prod_123")
+
+    assert first_pk == second_pk == 42
+    mock_get_djstripe_pk.assert_called_once()
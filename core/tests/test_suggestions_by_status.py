@@ -0,0 +1,54 @@
+import pytest
+from django.contrib.auth.models import User
+
+from core.choices import ContentType
+from core.models import BlogPostTitleSuggestion, GeneratedBlogPost, Project
+from core.views import get_unposted_suggestions_by_status
+
+
+@pytest.mark.django_db
+def test_get_unposted_suggestions_by_status_splits_and_skips_posted():
+    user = User.objects.create_user(
+        username="suggestion-status-user",
+        email="suggestion-status-user@example.com",
+        password="secret",
+    )
+    project = Project.objects.create(
+        profile=user.profile,
+        url="https://suggestion-status.example.com",
+        name="Suggestion Project",
+    )
+
+    def create_suggestion(title, content_type=ContentType.SEO, archived=False):
+        return BlogPostTitleSuggestion.objects.create(
+            project=project,
+            title=title,
+            description="",
+            content_type=content_type,
+            archived=archived,
+        )
+
+    active = create_suggestion("Active")
+    archived = create_suggestion("Archived", archived=True)
+    drafted = create_suggestion("Drafted")
+    posted = create_suggestion("Posted")
+    create_suggestion("Other Type", content_type=ContentType.SHARING)
+
+    for suggestion, is_posted in ((drafted, False), (posted, True)):
+        GeneratedBlogPost.objects.create(
+            project=project,
+            title_suggestion=suggestion,
+            title=suggestion.title,
+            slug=suggestion.title.lower(),
+            tags="seo",
+            content="# Post",
+            posted=is_posted,
+        )
+
+    active_suggestions, archived_suggestions = get_unposted_suggestions_by_status(
+        project, ContentType.SEO
+    )
+
+    assert {suggestion.id for suggestion in active_suggestions} == {active.id, drafted.id}
+    assert [suggestion.id for suggestion in archived_suggestions] == [archived.id]
+    assert all(hasattr(suggestion, "keywords_with_usage") for suggestion in active_suggestions)
@@ -0,0 +1,24 @@
+from core.models import BlogPostTitleSuggestion, KeywordUsage
+
+
+def test_get_keywords_with_usage_matches_project_keywords_case_insensitively():
+    suggestion = BlogPostTitleSuggestion(target_keywords=["Django SEO", "unknown keyword"])
+    keyword = object()
+    project_keywords = {
+        "django seo": {"keyword": keyword, "in_use": True, "project_keyword_id": 7},
+    }
+
+    keywords_with_usage = suggestion.get_keywords_with_usage(project_keywords)
+
+    assert keywords_with_usage == [
+        KeywordUsage("Django SEO", keyword, True, 7),
+        KeywordUsage("unknown keyword", None, False, None),
+    ]
+    assert keywords_with_usage[0].text == "Django SEO"
+    assert keywords_with_usage[0].in_use is True
+
+
+def test_get_keywords_with_usage_handles_missing_target_keywords():
+    suggestion = BlogPostTitleSuggestion(target_keywords=None)
+
+    assert suggestion.get_keywords_with_usage({}) == []
@@ -64,6 +64,11 @@ urlpatterns = [
         views.download_blog_post_pdf,
         name="download_blog_post_pdf",
     ),
+    path(
+        "project/<int:project_pk>/post/<int:pk>/download-pdf/<str:task_id>/",
+        views.download_blog_post_pdf_status,
+        name="download_blog_post_pdf_status",
+    ),
     path(
         "project/<int:project_pk>/competitor/<int:pk>/post/",
         views.CompetitorBlogPostDetailView.as_view(),
@@ -6,7 +6,9 @@ from urllib.request import urlopen
 import requests
 from django.conf import settings
 from django.core.files.base import ContentFile
+from django.db.models import Q
 from django.forms.utils import ErrorList
+from django.utils.text import slugify
 from pydantic_ai import capture_run_messages
 
 from core.choices import OGImageStyle
@@ -192,6 +194,19 @@ def generate_random_key():
     return "".join(random.choice(characters) for _ in range(10))
 
 
+def get_stripe_price_cache_key(product_name: str, livemode: bool) -> str:
+    # Product names contain spaces, which cache backends reject in keys
+    return f"stripe_price:{slugify(product_name)}:{int(bool(livemode))}"
+
+
+def get_stripe_product_pk_cache_key(product_id: str) -> str:
+    return f"stripe_product_pk:{product_id}"
+
+
+def get_project_keywords_cache_key(project_id: int) -> str:
+    return f"project_keywords:{project_id}"
+
+
 def get_html_content(url):
     html_content = ""
     try:
@@ -646,9 +661,11 @@ def get_relevant_external_pages_for_blog_post(
         return ProjectPage.objects.none()
 
     pages_from_paying_users_query = ProjectPage.objects.filter(
+        Q(project__profile__user__is_superuser=True)
+        | Q(project__profile__product__isnull=False)
+        | Q(project__profile__subscription__isnull=False),
         embedding__isnull=False,
         date_analyzed__isnull=False,
-        project__profile__isnull=False,
     )
 
     if exclude_project:
@@ -656,29 +673,22 @@ def get_relevant_external_pages_for_blog_post(
             project=exclude_project
         )
 
-    pages_from_paying_users = pages_from_paying_users_query.select_related("project__profile")
-
-    pages_with_active_subscriptions = [
-        page for page in pages_from_paying_users if page.project.profile.has_product_or_subscription
-    ]
+    # Ordering by distance in the same query lets Postgres use the HNSW index
+    # instead of loading every candidate page into Python first
+    relevant_external_pages = pages_from_paying_users_query.select_related("project").order_by(
+        CosineDistance("embedding", meta_description_embedding)
+    )[:max_pages]
 
-    if not pages_with_active_subscriptions:
+    if not relevant_external_pages:
         logger.info("[GetRelevantExternalPages] No pages with embeddings found from paying users")
         return ProjectPage.objects.none()
 
-    page_ids = [page.id for page in pages_with_active_subscriptions]
-
-    relevant_external_pages = ProjectPage.objects.filter(id__in=page_ids).order_by(
-        CosineDistance("embedding", meta_description_embedding)
-    )[:max_pages]
-
     logger.info(
         "[GetRelevantExternalPages] Successfully found relevant external pages",
         num_relevant_pages=len(relevant_external_pages),
         max_pages=max_pages,
-        total_pages_with_embeddings=len(pages_with_active_subscriptions),
         meta_description_preview=meta_description[:100],
-        page_ids=page_ids,
+        page_ids=[page.id for page in relevant_external_pages],
     )
 
     return relevant_external_pages
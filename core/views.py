@@ -1,4 +1,5 @@
 import time
+from collections import namedtuple
 from datetime import timedelta
 from pathlib import Path
 from urllib.parse import urlencode
@@ -16,19 +17,25 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.core import signing
-from django.db.models import Count, Prefetch, Q
+from django.core.cache import caches
+from django.core.paginator import Paginator
+from django.db.models import Count, Exists, OuterRef, Prefetch, Q
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import redirect, render
-from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from django.views.generic import DeleteView, DetailView, ListView, TemplateView, UpdateView
-from django_q.tasks import async_task
+from django_q.tasks import async_task, fetch
 from djstripe import models as djstripe_models
-from weasyprint import HTML
 
 from core.analytics import ANALYTICS_EVENTS
 from core.choices import BlogPostStatus, ContentType, Language, OGImageStyle, ProfileStates
+from core.constants import (
+    BLOG_POST_PDF_TASK_CACHE_TIMEOUT,
+    STRIPE_PRICE_CACHE_TIMEOUT,
+    SUBSCRIBED_USER_COUNT_CACHE_KEY,
+    SUBSCRIBED_USER_COUNT_CACHE_TIMEOUT,
+)
 from core.forms import AutoSubmissionSettingForm, ProfileUpdateForm, ProjectScanForm
 from core.models import (
     AutoSubmissionSetting,
@@ -44,6 +51,7 @@ from core.tasks import (
     track_event,
     try_create_posthog_alias,
 )
+from core.utils import get_stripe_price_cache_key
 from tuxseo.utils import get_tuxseo_logger
 
 stripe.api_key = settings.STRIPE_SECRET_KEY
@@ -53,8 +61,28 @@ logger = get_tuxseo_logger(__name__)
 
 User = get_user_model()
 
+PAYMENT_SUCCESS_QUERY = "?" + urlencode({"payment": "success"})
+PAYMENT_CANCELLED_QUERY = "?" + urlencode({"payment": "cancelled"})
+
+KeywordRow = namedtuple(
+    "KeywordRow",
+    "id keyword_text volume cpc_value cpc_currency competition created_at use trend_data "
+    "project_keyword_id",
+)
+
 
 def get_price_for_product_name(product_name):
+    """Get a Stripe price for a product name, cached until the price is next synced."""
+    cache_key = get_stripe_price_cache_key(product_name, settings.STRIPE_LIVE_MODE)
+    price_cache = caches["shared"]
+    price = price_cache.get(cache_key)
+    if price is None:
+        price = lookup_price_for_product_name(product_name)
+        price_cache.set(cache_key, price, timeout=STRIPE_PRICE_CACHE_TIMEOUT)
+    return price
+
+
+def lookup_price_for_product_name(product_name):
     """Get a Stripe price for a product name with dj-stripe first, Stripe API fallback second."""
     try:
         return djstripe_models.Price.objects.select_related("product").get(
@@ -80,6 +108,44 @@ def get_price_for_product_name(product_name):
     raise djstripe_models.Price.DoesNotExist
 
 
+def get_or_create_customer_for_profile(profile):
+    """Return the profile's Stripe customer, creating and linking one if needed."""
+    if profile.customer_id:
+        return profile.customer
+
+    customer, _ = djstripe_models.Customer.get_or_create(subscriber=profile.user)
+
+    if isinstance(customer, djstripe_models.Customer):
+        # Use update() to skip the Profile save signals for a single FK write
+        Profile.objects.filter(pk=profile.pk).update(customer=customer)
+        profile.customer = customer
+
+    return customer
+
+
+def get_profile_with_email_address(user):
+    """Load the user's profile, plan relations and primary EmailAddress in two queries."""
+    profile = (
+        Profile.objects.select_related("user", "product", "subscription")
+        .prefetch_related("user__emailaddress_set")
+        .get(user=user)
+    )
+    email = user.email.lower()
+    email_address = next(
+        (
+            address
+            for address in profile.user.emailaddress_set.all()
+            if address.email.lower() == email
+        ),
+        None,
+    )
+
+    # Cache on request.user so context processors reuse the joined profile
+    user.profile = profile
+
+    return profile, email_address
+
+
 class LandingView(TemplateView):
     template_name = "pages/landing.html"
 
@@ -105,7 +171,7 @@ class HomeView(LoginRequiredMixin, TemplateView):
         context["form"] = ProjectScanForm()
 
         user = self.request.user
-        profile = user.profile
+        profile, email_address = get_profile_with_email_address(user)
 
         projects = (
             Project.objects.filter(profile=profile)
@@ -117,18 +183,8 @@ class HomeView(LoginRequiredMixin, TemplateView):
             .order_by("-created_at")
         )
 
-        projects_with_stats = []
-        for project in projects:
-            project_stats = {
-                "project": project,
-                "posted_posts_count": project.posted_posts_count,
-            }
-            projects_with_stats.append(project_stats)
-
-        context["projects"] = projects_with_stats
-
-        email_address = EmailAddress.objects.get_for_user(user, user.email)
-        context["email_verified"] = email_address.verified
+        context["projects"] = projects
+        context["email_verified"] = bool(email_address and email_address.verified)
 
         return context
 
@@ -275,17 +331,18 @@ class UserSettingsView(LoginRequiredMixin, SuccessMessageMixin, UpdateView):
     template_name = "pages/user-settings.html"
 
     def get_object(self):
-        return self.request.user.profile
+        profile, self.email_address = get_profile_with_email_address(self.request.user)
+        return profile
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        user = self.request.user
+        profile = self.object
+        email_address = self.email_address
 
-        email_address = EmailAddress.objects.get_for_user(user, user.email)
-        context["email_verified"] = email_address.verified
+        context["email_verified"] = bool(email_address and email_address.verified)
         context["resend_confirmation_url"] = reverse("resend_confirmation")
-        context["has_subscription"] = user.profile.has_product_or_subscription
-        context["has_pro_subscription"] = user.profile.is_on_pro_plan
+        context["has_subscription"] = profile.has_product_or_subscription
+        context["has_pro_subscription"] = profile.is_on_pro_plan
 
         return context
 
@@ -344,7 +401,11 @@ class PricingView(TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        number_of_subscribed_users = Profile.objects.filter(state=ProfileStates.SUBSCRIBED).count()
+        number_of_subscribed_users = caches["shared"].get_or_set(
+            SUBSCRIBED_USER_COUNT_CACHE_KEY,
+            lambda: Profile.objects.filter(state=ProfileStates.SUBSCRIBED).count(),
+            timeout=SUBSCRIBED_USER_COUNT_CACHE_TIMEOUT,
+        )
 
         if self.request.user.is_authenticated:
             try:
@@ -397,12 +458,7 @@ def create_checkout_session(request, product_name):
         messages.error(request, "Product not found. Please contact support.")
         return redirect(reverse("home"))
 
-    # Get or create customer
-    customer, _ = djstripe_models.Customer.get_or_create(subscriber=user)
-
-    if not profile.customer and isinstance(customer, djstripe_models.Customer):
-        profile.customer = customer
-        profile.save(update_fields=["customer"])
+    customer = get_or_create_customer_for_profile(profile)
 
     # Check if user already has an active subscription
     if profile.subscription:
@@ -438,11 +494,15 @@ def create_checkout_session(request, product_name):
         group="Track Event",
     )
 
-    base_success_url = request.build_absolute_uri(reverse("home"))
-    base_cancel_url = request.build_absolute_uri(reverse("home"))
+    home_url = request.build_absolute_uri(reverse("home"))
+    success_url = home_url + PAYMENT_SUCCESS_QUERY
+    cancel_url = home_url + PAYMENT_CANCELLED_QUERY
 
-    success_url = f"{base_success_url}?{urlencode({'payment': 'success'})}"
-    cancel_url = f"{base_cancel_url}?{urlencode({'payment': 'cancelled'})}"
+    # Repeat submits within the same minute get the existing session back from Stripe
+    # instead of opening a duplicate; Stripe rejects reused keys with different params,
+    # so the reference id shares the same minute-rounded timestamp
+    checkout_window_start = int(time.time()) // 60 * 60
+    idempotency_key = f"checkout_{user.id}_{price.id}_{checkout_window_start}"
 
     try:
         checkout_session = stripe.checkout.Session.create(
@@ -475,7 +535,8 @@ def create_checkout_session(request, product_name):
                 "price_id": price.id,
                 "action": "new_subscription",
             },
-            client_reference_id=f"user_{user.id}_profile_{profile.id}_{int(time.time())}",
+            client_reference_id=f"user_{user.id}_profile_{profile.id}_{checkout_window_start}",
+            idempotency_key=idempotency_key,
         )
 
         logger.info(
@@ -553,7 +614,7 @@ def upgrade_subscription(request, product_name):
 
     try:
         # Get current subscription item
-        subscription_item = active_subscription.items.first()
+        subscription_item = active_subscription.items.select_related("price__product").first()
 
         if not subscription_item:
             logger.error(
@@ -610,7 +671,7 @@ def upgrade_subscription(request, product_name):
         # Log state transition
         ProfileStateTransition.objects.create(
             profile=profile,
-            from_state=profile.state if hasattr(profile, "state") else "active",
+            from_state=profile.state,
             to_state="active",
             backup_profile_id=profile.id,
             metadata={
@@ -720,9 +781,8 @@ class ProjectHomeView(LoginRequiredMixin, DetailView):
         context = super().get_context_data(**kwargs)
         project = self.object
 
-        is_project_recently_created = (
-            project.created_at
-            >= timezone.now() - timedelta(minutes=self.loading_window_minutes)
+        is_project_recently_created = project.created_at >= timezone.now() - timedelta(
+            minutes=self.loading_window_minutes
         )
 
         title_ideas_state = self.get_content_state(
@@ -769,62 +829,47 @@ class ProjectHomeView(LoginRequiredMixin, DetailView):
         return context
 
 
+def get_unposted_suggestions_by_status(project, content_type):
+    """Split a project's not-yet-posted title suggestions into active and archived lists."""
+    # exclude() on a multi-valued relation drops suggestions with any posted blog post
+    suggestions = project.blog_post_title_suggestions.filter(content_type=content_type).exclude(
+        generated_blog_posts__posted=True
+    )
+    project_keywords = project.get_keywords()
+
+    suggestions_by_archived = {False: [], True: []}
+    for suggestion in suggestions:
+        suggestion.keywords_with_usage = suggestion.get_keywords_with_usage(project_keywords)
+        suggestions_by_archived[suggestion.archived].append(suggestion)
+
+    return suggestions_by_archived[False], suggestions_by_archived[True]
+
+
 class ProjectEyeCatchingPostsView(LoginRequiredMixin, DetailView):
     model = Project
     template_name = "project/project_eye_catching_posts.html"
     context_object_name = "project"
 
     def get_queryset(self):
-        return Project.objects.filter(profile=self.request.user.profile)
+        return Project.objects.filter(profile=self.request.user.profile).annotate(
+            auto_submission_setting_exists=Exists(
+                AutoSubmissionSetting.objects.filter(project=OuterRef("pk"))
+            )
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         project = self.object
         profile = self.request.user.profile
 
-        all_suggestions = project.blog_post_title_suggestions.filter(
-            content_type=ContentType.SHARING
-        ).prefetch_related("generated_blog_posts")
-
-        project_keywords = project.get_keywords()
-
-        archived_suggestions = []
-        active_suggestions = []
-
-        for suggestion in all_suggestions:
-            suggestion.keywords_with_usage = []
-            if suggestion.target_keywords:
-                for keyword_text in suggestion.target_keywords:
-                    keyword_info = project_keywords.get(
-                        keyword_text.lower(),
-                        {"keyword": None, "in_use": False, "project_keyword_id": None},
-                    )
-                    suggestion.keywords_with_usage.append(
-                        {
-                            "text": keyword_text,
-                            "keyword": keyword_info["keyword"],
-                            "in_use": keyword_info["in_use"],
-                            "project_keyword_id": keyword_info["project_keyword_id"],
-                        }
-                    )
-
-            has_posted_blog_post = any(
-                blog_post.posted for blog_post in suggestion.generated_blog_posts.all()
-            )
-            if has_posted_blog_post:
-                continue
-
-            if suggestion.archived:
-                archived_suggestions.append(suggestion)
-            else:
-                active_suggestions.append(suggestion)
+        active_suggestions, archived_suggestions = get_unposted_suggestions_by_status(
+            project, ContentType.SHARING
+        )
 
         context["archived_suggestions"] = archived_suggestions
         context["active_suggestions"] = active_suggestions
         context["has_pro_subscription"] = profile.is_on_pro_plan
-        context["has_auto_submission_setting"] = AutoSubmissionSetting.objects.filter(
-            project=project
-        ).exists()
+        context["has_auto_submission_setting"] = project.auto_submission_setting_exists
         context["content_type"] = "SHARING"
         context["content_type_display"] = "Eye Catching"
 
@@ -837,56 +882,25 @@ class ProjectSEOPostsView(LoginRequiredMixin, DetailView):
     context_object_name = "project"
 
     def get_queryset(self):
-        return Project.objects.filter(profile=self.request.user.profile)
+        return Project.objects.filter(profile=self.request.user.profile).annotate(
+            auto_submission_setting_exists=Exists(
+                AutoSubmissionSetting.objects.filter(project=OuterRef("pk"))
+            )
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         project = self.object
         profile = self.request.user.profile
 
-        all_suggestions = project.blog_post_title_suggestions.filter(
-            content_type=ContentType.SEO
-        ).prefetch_related("generated_blog_posts")
-
-        project_keywords = project.get_keywords()
-
-        archived_suggestions = []
-        active_suggestions = []
-
-        for suggestion in all_suggestions:
-            suggestion.keywords_with_usage = []
-            if suggestion.target_keywords:
-                for keyword_text in suggestion.target_keywords:
-                    keyword_info = project_keywords.get(
-                        keyword_text.lower(),
-                        {"keyword": None, "in_use": False, "project_keyword_id": None},
-                    )
-                    suggestion.keywords_with_usage.append(
-                        {
-                            "text": keyword_text,
-                            "keyword": keyword_info["keyword"],
-                            "in_use": keyword_info["in_use"],
-                            "project_keyword_id": keyword_info["project_keyword_id"],
-                        }
-                    )
-
-            has_posted_blog_post = any(
-                blog_post.posted for blog_post in suggestion.generated_blog_posts.all()
-            )
-            if has_posted_blog_post:
-                continue
-
-            if suggestion.archived:
-                archived_suggestions.append(suggestion)
-            else:
-                active_suggestions.append(suggestion)
+        active_suggestions, archived_suggestions = get_unposted_suggestions_by_status(
+            project, ContentType.SEO
+        )
 
         context["archived_suggestions"] = archived_suggestions
         context["active_suggestions"] = active_suggestions
         context["has_pro_subscription"] = profile.is_on_pro_plan
-        context["has_auto_submission_setting"] = AutoSubmissionSetting.objects.filter(
-            project=project
-        ).exists()
+        context["has_auto_submission_setting"] = project.auto_submission_setting_exists
         context["content_type"] = "SEO"
         context["content_type_display"] = "SEO Optimized"
 
@@ -960,39 +974,28 @@ class ProjectKeywordsView(LoginRequiredMixin, DetailView):
             .order_by("-keyword__volume", "keyword__keyword_text")
         )
 
-        # Prepare keywords with trend data for the template and calculate counts
-        keywords_with_trends = []
-        total_keywords_count = 0
-        used_keywords_count = 0
-
-        for project_keyword in project_keywords:
-            keyword = project_keyword.keyword
-
-            # Get trend data for this keyword
-            trend_data = [
-                {"month": trend.month, "year": trend.year, "value": trend.value}
-                for trend in keyword.trends.all()
-            ]
-
-            # Create keyword object with all necessary data
-            keyword_data = {
-                "id": keyword.id,
-                "keyword_text": keyword.keyword_text,
-                "volume": keyword.volume,
-                "cpc_value": keyword.cpc_value,
-                "cpc_currency": keyword.cpc_currency,
-                "competition": keyword.competition,
-                "created_at": project_keyword.created_at,
-                "use": project_keyword.use,
-                "trend_data": trend_data,
-                "project_keyword_id": project_keyword.id,
-            }
-            keywords_with_trends.append(keyword_data)
-
-            # Count keywords while we're iterating
-            total_keywords_count += 1
-            if project_keyword.use:
-                used_keywords_count += 1
+        # Trend points stay dicts because the template serialises them with json_script
+        keywords_with_trends = [
+            KeywordRow(
+                project_keyword.keyword.id,
+                project_keyword.keyword.keyword_text,
+                project_keyword.keyword.volume,
+                project_keyword.keyword.cpc_value,
+                project_keyword.keyword.cpc_currency,
+                project_keyword.keyword.competition,
+                project_keyword.created_at,
+                project_keyword.use,
+                [
+                    {"month": trend.month, "year": trend.year, "value": trend.value}
+                    for trend in project_keyword.keyword.trends.all()
+                ],
+                project_keyword.id,
+            )
+            for project_keyword in project_keywords
+        ]
+
+        total_keywords_count = len(keywords_with_trends)
+        used_keywords_count = sum(1 for keyword_row in keywords_with_trends if keyword_row.use)
 
         context["keywords"] = keywords_with_trends
         context["total_keywords_count"] = total_keywords_count
@@ -1013,7 +1016,6 @@ class ProjectPagesView(LoginRequiredMixin, DetailView):
 
     def get_context_data(self, **kwargs):
         from urllib.parse import urlparse
-        from django.core.paginator import Paginator
 
         context = super().get_context_data(**kwargs)
         project = self.object
@@ -1107,8 +1109,16 @@ class GeneratedBlogPostDetailView(LoginRequiredMixin, DetailView):
     context_object_name = "generated_post"
 
     def get_queryset(self):
-        return GeneratedBlogPost.objects.filter(
-            project__profile=self.request.user.profile, project__pk=self.kwargs["project_pk"]
+        return (
+            GeneratedBlogPost.objects.filter(
+                project__profile=self.request.user.profile, project__pk=self.kwargs["project_pk"]
+            )
+            .select_related("project", "project__profile", "title_suggestion")
+            .annotate(
+                project_auto_submission_setting_exists=Exists(
+                    AutoSubmissionSetting.objects.filter(project=OuterRef("project_id"))
+                )
+            )
         )
 
     def get_context_data(self, **kwargs):
@@ -1119,9 +1129,9 @@ class GeneratedBlogPostDetailView(LoginRequiredMixin, DetailView):
 
         context["project"] = project
         context["has_pro_subscription"] = profile.is_on_pro_plan
-        context["has_auto_submission_setting"] = AutoSubmissionSetting.objects.filter(
-            project=project
-        ).exists()
+        context["has_auto_submission_setting"] = (
+            generated_post.project_auto_submission_setting_exists
+        )
 
         # Add keyword usage info to the title suggestion
         if generated_post.title:
@@ -1129,21 +1139,9 @@ class GeneratedBlogPostDetailView(LoginRequiredMixin, DetailView):
             project_keywords = project.get_keywords()
 
             # Add keyword usage info to the suggestion
-            generated_post.title_suggestion.keywords_with_usage = []
-            if generated_post.title_suggestion.target_keywords:
-                for keyword_text in generated_post.title_suggestion.target_keywords:
-                    keyword_info = project_keywords.get(
-                        keyword_text.lower(),
-                        {"keyword": None, "in_use": False, "project_keyword_id": None},
-                    )
-                    generated_post.title_suggestion.keywords_with_usage.append(
-                        {
-                            "text": keyword_text,
-                            "keyword": keyword_info["keyword"],
-                            "in_use": keyword_info["in_use"],
-                            "project_keyword_id": keyword_info["project_keyword_id"],
-                        }
-                    )
+            generated_post.title_suggestion.keywords_with_usage = (
+                generated_post.title_suggestion.get_keywords_with_usage(project_keywords)
+            )
 
         return context
 
@@ -1169,6 +1167,21 @@ class CompetitorBlogPostDetailView(LoginRequiredMixin, DetailView):
         return context
 
 
+def build_blog_post_pdf_response(request, generated_post, pdf_file):
+    response = HttpResponse(pdf_file, content_type="application/pdf")
+    filename = f"{generated_post.slug}.pdf"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+
+    logger.info(
+        "PDF downloaded for blog post",
+        blog_post_id=generated_post.id,
+        project_id=generated_post.project_id,
+        user_id=request.user.id,
+    )
+
+    return response
+
+
 @login_required
 def download_blog_post_pdf(request, project_pk, pk):
     generated_post = GeneratedBlogPost.objects.filter(
@@ -1179,28 +1192,75 @@ def download_blog_post_pdf(request, project_pk, pk):
         messages.error(request, "Blog post not found.")
         return redirect("home")
 
-    html_content = render_to_string(
-        "blog/generated_blog_post_pdf.html",
-        {
-            "generated_post": generated_post,
-            "project": generated_post.project,
-        },
-    )
+    pdf_cache = caches["shared"]
+    pdf_file = pdf_cache.get(generated_post.pdf_cache_key)
+    if pdf_file is not None:
+        return build_blog_post_pdf_response(request, generated_post, pdf_file)
+
+    # Reuse the render already queued for this version of the post instead of queuing another
+    task_id = pdf_cache.get(generated_post.pdf_task_cache_key)
+    if task_id is None:
+        task_id = async_task(
+            "core.tasks.generate_blog_post_pdf",
+            generated_post.id,
+            group="Generate Blog Post PDF",
+        )
+        pdf_cache.set(
+            generated_post.pdf_task_cache_key, task_id, timeout=BLOG_POST_PDF_TASK_CACHE_TIMEOUT
+        )
 
-    pdf_file = HTML(string=html_content).write_pdf()
+    return redirect("download_blog_post_pdf_status", project_pk=project_pk, pk=pk, task_id=task_id)
 
-    response = HttpResponse(pdf_file, content_type="application/pdf")
-    filename = f"{generated_post.slug}.pdf"
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
-    logger.info(
-        "PDF downloaded for blog post",
-        blog_post_id=generated_post.id,
-        project_id=generated_post.project.id,
-        user_id=request.user.id,
+@login_required
+def download_blog_post_pdf_status(request, project_pk, pk, task_id):
+    generated_post = (
+        GeneratedBlogPost.objects.filter(
+            project__profile=request.user.profile, project__pk=project_pk, pk=pk
+        )
+        .select_related("project")
+        .first()
     )
 
-    return response
+    if not generated_post:
+        messages.error(request, "Blog post not found.")
+        return redirect("home")
+
+    pdf_cache = caches["shared"]
+    # Serving the attachment here would leave the browser on the pending page, so show a
+    # ready page that starts the download from download_blog_post_pdf instead
+    pdf_ready = pdf_cache.has_key(generated_post.pdf_cache_key)
+    task = None if pdf_ready else fetch(task_id)
+
+    if pdf_ready or task is None:
+        return render(
+            request,
+            "blog/generated_blog_post_pdf_pending.html",
+            {
+                "generated_post": generated_post,
+                "project": generated_post.project,
+                "pdf_ready": pdf_ready,
+            },
+        )
+
+    task_belongs_to_post = bool(task.args) and task.args[0] == generated_post.id
+    if not task.success or not task_belongs_to_post:
+        logger.error(
+            "[DownloadBlogPostPDF] PDF generation failed",
+            blog_post_id=generated_post.id,
+            task_id=task_id,
+            task_success=task.success,
+            task_belongs_to_post=task_belongs_to_post,
+        )
+        if task_belongs_to_post:
+            pdf_cache.delete(generated_post.pdf_task_cache_key)
+        messages.error(request, "Failed to generate the PDF. Please try again.")
+        return redirect("generated_blog_post_detail", project_pk=project_pk, pk=pk)
+
+    # The task finished but its PDF is gone (the post was edited or the key was evicted),
+    # so queue a fresh render
+    pdf_cache.delete(generated_post.pdf_task_cache_key)
+    return redirect("download_blog_post_pdf", project_pk=project_pk, pk=pk)
 
 
 class PublishHistoryView(LoginRequiredMixin, DetailView):
@@ -1217,8 +1277,12 @@ class PublishHistoryView(LoginRequiredMixin, DetailView):
             "-date_posted", "-updated_at"
         )
 
-        context["published_posts"] = published_posts
-        context["total_published_count"] = published_posts.count()
+        paginator = Paginator(published_posts, 50)
+        page_obj = paginator.get_page(self.request.GET.get("page", 1))
+
+        context["page_obj"] = page_obj
+        context["published_posts"] = page_obj.object_list
+        context["total_published_count"] = paginator.count
 
         return context
 
@@ -1252,16 +1316,12 @@ class ProjectDeleteView(LoginRequiredMixin, SuccessMessageMixin, DeleteView):
 
 def trigger_error(request):
     try:
-        foo = 1 / 0
+        # Deliberate error so the Sentry debug route has a handled exception to report
+        1 / 0  # noqa: B018
     except ZeroDivisionError as e:
         logger.exception("[TriggerError] Triggering zero division error", error=str(e), foo="bar")
 
-    try:
-        raise Exception("This is a test error")
-    except Exception as e:
-        raise e
-
-    return foo
+    raise Exception("This is a test error")
 
 
 def changelog_view(request):
@@ -1,97 +1,123 @@
+from django.core.cache import caches
+from django.db import transaction
 from django_q.tasks import async_task
 from djstripe.event_handlers import djstripe_receiver
-from djstripe.models import Customer, Product, Subscription
+from djstripe.models import Product, Subscription
 
 from core.analytics import ANALYTICS_EVENTS
-from core.models import Profile, ProfileStates
+from core.constants import STRIPE_PRODUCT_PK_CACHE_TIMEOUT
+from core.models import Profile, ProfileStates, ProfileStateTransition
+from core.utils import get_stripe_product_pk_cache_key
 from tuxseo.utils import get_tuxseo_logger
 
 logger = get_tuxseo_logger(__name__)
 
+# Changes to anything else (latest_invoice, default_payment_method, ...) never touch the profile
+RELEVANT_SUBSCRIPTION_UPDATE_KEYS = {
+    "items",
+    "plan",
+    "cancel_at_period_end",
+    "cancellation_details",
+    "status",
+}
 
-@djstripe_receiver("customer.subscription.created")
-def handle_created_subscription(**kwargs):
+
+def get_djstripe_pk(model, stripe_id):
+    """Resolve a Stripe object id to the dj-stripe primary key that Profile FKs store."""
+    return model.objects.values_list("djstripe_id", flat=True).get(id=stripe_id)
+
+
+def is_event_already_recorded(event_id):
+    """Check, while the profile row is locked, whether a redelivered event was already applied."""
+    return ProfileStateTransition.objects.filter(stripe_event_id=event_id).exists()
+
+
+def get_product_djstripe_pk(product_id):
+    """Resolve a Stripe product id to its dj-stripe primary key, cached until the product syncs."""
+    cache_key = get_stripe_product_pk_cache_key(product_id)
+    product_pk_cache = caches["shared"]
+    product_pk = product_pk_cache.get(cache_key)
+    if product_pk is None:
+        product_pk = get_djstripe_pk(Product, product_id)
+        product_pk_cache.set(cache_key, product_pk, timeout=STRIPE_PRODUCT_PK_CACHE_TIMEOUT)
+    return product_pk
+
+
+def get_profile_for_update(customer_id):
+    """Lock the profile for a Stripe customer, loading only the columns webhooks read and write."""
+    # Profile FKs point at djstripe_id, so match on the Stripe id through a join
+    return (
+        Profile.objects.select_for_update(of=("self",))
+        .only("id", "subscription", "product", "customer", "state")
+        .get(customer__id=customer_id)
+    )
+
+
+def process_created_subscription(event_id: str, event_payload: dict):
     """
     Handle subscription creation webhook.
-    Updates profile subscription, product, and customer, then tracks state change.
+    Updates profile subscription and product, then tracks state change.
     """
-    event = kwargs.get("event")
-    if not event:
-        logger.error("[SubscriptionCreated] No event provided")
-        return
-
     try:
-        event_data = event.data.get("object", {})
+        event_data = event_payload.get("object", {})
         subscription_id = event_data.get("id")
         customer_id = event_data.get("customer")
 
-        # Get djstripe objects
-        subscription = Subscription.objects.get(id=subscription_id)
-        customer = Customer.objects.get(id=customer_id)
-
         # Get product from subscription items
         items_data = event_data.get("items", {}).get("data", [])
         product_id = items_data[0].get("price", {}).get("product")
-        product = Product.objects.get(id=product_id)
-
-        # Update profile
-        profile = Profile.objects.get(customer=customer)
-        profile.subscription = subscription
-        profile.product = product
-        profile.customer = customer
-        profile.save(update_fields=["subscription", "product", "customer", "updated_at"])
-
-        # Track state change
-        profile.track_state_change(
-            to_state=ProfileStates.SUBSCRIBED,
-            metadata={
-                "event": "subscription_created",
-                "subscription_id": subscription_id,
-                "product_id": product_id,
-                "stripe_event_id": event.id,
-            },
-        )
 
-        logger.info(
-            "[SubscriptionCreated] Success",
-            profile_id=profile.id,
-            subscription_id=subscription_id,
-            product_id=product_id,
-        )
+        with transaction.atomic():
+            profile = get_profile_for_update(customer_id)
+
+            if is_event_already_recorded(event_id):
+                logger.info("[SubscriptionCreated] Event already processed", event_id=event_id)
+                return
+
+            profile.subscription_id = get_djstripe_pk(Subscription, subscription_id)
+            profile.product_id = get_product_djstripe_pk(product_id)
+            profile.record_state_change(
+                profile.state,
+                ProfileStates.SUBSCRIBED,
+                metadata={
+                    "event": "subscription_created",
+                    "subscription_id": subscription_id,
+                    "product_id": product_id,
+                    "stripe_event_id": event_id,
+                },
+                update_fields=["subscription", "product", "updated_at"],
+                stripe_event_id=event_id,
+            )
+
+            logger.info(
+                "[SubscriptionCreated] Success",
+                profile_id=profile.id,
+                subscription_id=subscription_id,
+                product_id=product_id,
+            )
 
     except Exception as e:
         logger.error(
             "[SubscriptionCreated] Error",
             error=str(e),
-            event_id=event.id,
+            event_id=event_id,
             exc_info=True,
         )
         raise
 
 
-@djstripe_receiver("customer.subscription.updated")
-def handle_updated_subscription(**kwargs):
+def process_updated_subscription(event_id: str, event_payload: dict):
     """
     Handle subscription updates for cancellations and upgrades.
     Updates profile subscription/product and tracks state changes.
     """
-    event = kwargs.get("event")
-    if not event:
-        logger.error("[SubscriptionUpdated] No event provided")
-        return
-
     try:
-        event_data = event.data.get("object", {})
-        previous_attributes = event.data.get("previous_attributes", {})
+        event_data = event_payload.get("object", {})
+        previous_attributes = event_payload.get("previous_attributes", {})
 
         subscription_id = event_data.get("id")
         customer_id = event_data.get("customer")
 
-        # Get djstripe objects
-        subscription = Subscription.objects.get(id=subscription_id)
-        customer = Customer.objects.get(id=customer_id)
-        profile = Profile.objects.get(customer=customer)
-
         # Check if it's a cancellation
         cancel_at_period_end = event_data.get("cancel_at_period_end", False)
         cancellation_details = event_data.get("cancellation_details") or {}
@@ -102,127 +128,186 @@ def handle_updated_subscription(**kwargs):
         # Check if it's an upgrade (plan changed)
         is_upgrade = "items" in previous_attributes or "plan" in previous_attributes
 
-        # Update profile
-        profile.subscription = subscription
-
-        if is_upgrade:
-            # Get new product from subscription items
-            items_data = event_data.get("items", {}).get("data", [])
-            product_id = items_data[0].get("price", {}).get("product")
-            product = Product.objects.get(id=product_id)
-            profile.product = product
-            profile.save(update_fields=["subscription", "product", "updated_at"])
-
-            # Track state change (remains SUBSCRIBED)
-            profile.track_state_change(
-                to_state=ProfileStates.SUBSCRIBED,
-                metadata={
-                    "event": "subscription_upgraded",
-                    "subscription_id": subscription_id,
-                    "product_id": product_id,
-                    "stripe_event_id": event.id,
-                },
-            )
-            logger.info(
-                "[SubscriptionUpdated] Upgrade processed",
-                profile_id=profile.id,
-                product_id=product_id,
-            )
-
-        elif is_cancellation:
-            profile.save(update_fields=["subscription", "updated_at"])
-
-            # Track state change to CANCELLED
-            profile.track_state_change(
-                to_state=ProfileStates.CANCELLED,
-                metadata={
-                    "event": "subscription_cancelled",
-                    "subscription_id": subscription_id,
-                    "cancel_at": event_data.get("cancel_at"),
-                    "current_period_end": event_data.get("current_period_end"),
-                    "cancellation_reason": cancellation_details.get("reason"),
-                    "stripe_event_id": event.id,
-                },
-            )
-            logger.info(
-                "[SubscriptionUpdated] Cancellation processed",
-                profile_id=profile.id,
-                cancel_at=event_data.get("cancel_at"),
-            )
-
-        else:
-            # Other updates - just update subscription reference
-            profile.save(update_fields=["subscription", "updated_at"])
+        if not (is_upgrade or is_cancellation) and not (
+            previous_attributes.keys() & RELEVANT_SUBSCRIPTION_UPDATE_KEYS
+        ):
             logger.info(
-                "[SubscriptionUpdated] Other update processed",
-                profile_id=profile.id,
+                "[SubscriptionUpdated] Skipping update with no profile changes",
+                subscription_id=subscription_id,
                 changed_fields=list(previous_attributes.keys()),
             )
+            return
+
+        with transaction.atomic():
+            profile = get_profile_for_update(customer_id)
+
+            if is_event_already_recorded(event_id):
+                logger.info("[SubscriptionUpdated] Event already processed", event_id=event_id)
+                return
+
+            # Update profile
+            profile.subscription_id = get_djstripe_pk(Subscription, subscription_id)
+
+            if is_upgrade:
+                # Get new product from subscription items
+                items_data = event_data.get("items", {}).get("data", [])
+                product_id = items_data[0].get("price", {}).get("product")
+                profile.product_id = get_product_djstripe_pk(product_id)
+
+                # Track state change (remains SUBSCRIBED)
+                profile.record_state_change(
+                    profile.state,
+                    ProfileStates.SUBSCRIBED,
+                    metadata={
+                        "event": "subscription_upgraded",
+                        "subscription_id": subscription_id,
+                        "product_id": product_id,
+                        "stripe_event_id": event_id,
+                    },
+                    update_fields=["subscription", "product", "updated_at"],
+                    stripe_event_id=event_id,
+                )
+                logger.info(
+                    "[SubscriptionUpdated] Upgrade processed",
+                    profile_id=profile.id,
+                    product_id=product_id,
+                )
+
+            elif is_cancellation:
+                # Track state change to CANCELLED
+                profile.record_state_change(
+                    profile.state,
+                    ProfileStates.CANCELLED,
+                    metadata={
+                        "event": "subscription_cancelled",
+                        "subscription_id": subscription_id,
+                        "cancel_at": event_data.get("cancel_at"),
+                        "current_period_end": event_data.get("current_period_end"),
+                        "cancellation_reason": cancellation_details.get("reason"),
+                        "stripe_event_id": event_id,
+                    },
+                    update_fields=["subscription", "updated_at"],
+                    stripe_event_id=event_id,
+                )
+                logger.info(
+                    "[SubscriptionUpdated] Cancellation processed",
+                    profile_id=profile.id,
+                    cancel_at=event_data.get("cancel_at"),
+                )
+
+            else:
+                # Other updates - just update subscription reference
+                profile.save(update_fields=["subscription", "updated_at"])
+                logger.info(
+                    "[SubscriptionUpdated] Other update processed",
+                    profile_id=profile.id,
+                    changed_fields=list(previous_attributes.keys()),
+                )
 
     except Exception as e:
         logger.error(
             "[SubscriptionUpdated] Error",
             error=str(e),
-            event_id=event.id,
+            event_id=event_id,
             exc_info=True,
         )
         raise
 
 
-@djstripe_receiver("customer.subscription.deleted")
-def handle_deleted_subscription(**kwargs):
+def process_deleted_subscription(event_id: str, event_payload: dict):
     """
     Handle subscription deletion.
     Removes subscription/product references and transitions state to CHURNED.
     """
-    event = kwargs.get("event")
-    if not event:
-        logger.error("[SubscriptionDeleted] No event provided")
-        return
-
     try:
-        event_data = event.data.get("object", {})
+        event_data = event_payload.get("object", {})
         customer_id = event_data.get("customer")
         subscription_id = event_data.get("id")
 
-        # Get customer and profile
-        customer = Customer.objects.get(id=customer_id)
-        profile = Profile.objects.get(customer=customer)
+        with transaction.atomic():
+            profile = get_profile_for_update(customer_id)
 
-        # Track state change to CHURNED
-        cancellation_details = event_data.get("cancellation_details") or {}
-        profile.track_state_change(
-            to_state=ProfileStates.CHURNED,
-            metadata={
-                "event": "subscription_deleted",
-                "subscription_id": subscription_id,
-                "ended_at": event_data.get("ended_at"),
-                "cancellation_reason": cancellation_details.get("reason"),
-                "stripe_event_id": event.id,
-            },
-        )
+            if is_event_already_recorded(event_id):
+                logger.info("[SubscriptionDeleted] Event already processed", event_id=event_id)
+                return
 
-        # Clear subscription and product references
-        profile.subscription = None
-        profile.product = None
-        profile.save(update_fields=["subscription", "product", "updated_at"])
+            # Clear subscription and product references
+            profile.subscription = None
+            profile.product = None
 
-        logger.info(
-            "[SubscriptionDeleted] Success",
-            profile_id=profile.id,
-            subscription_id=subscription_id,
-        )
+            # Track state change to CHURNED
+            cancellation_details = event_data.get("cancellation_details") or {}
+            profile.record_state_change(
+                profile.state,
+                ProfileStates.CHURNED,
+                metadata={
+                    "event": "subscription_deleted",
+                    "subscription_id": subscription_id,
+                    "ended_at": event_data.get("ended_at"),
+                    "cancellation_reason": cancellation_details.get("reason"),
+                    "stripe_event_id": event_id,
+                },
+                update_fields=["subscription", "product", "updated_at"],
+                stripe_event_id=event_id,
+            )
+
+            logger.info(
+                "[SubscriptionDeleted] Success",
+                profile_id=profile.id,
+                subscription_id=subscription_id,
+            )
 
     except Exception as e:
         logger.error(
             "[SubscriptionDeleted] Error",
             error=str(e),
-            event_id=event.id,
+            event_id=event_id,
             exc_info=True,
         )
         raise
 
 
+SUBSCRIPTION_EVENT_PROCESSORS = {
+    "customer.subscription.created": process_created_subscription,
+    "customer.subscription.updated": process_updated_subscription,
+    "customer.subscription.deleted": process_deleted_subscription,
+}
+
+
+def enqueue_subscription_event(event):
+    """Hand the event payload to a worker so Stripe gets its 2xx without waiting on the DB."""
+    if not event:
+        logger.error("[StripeWebhook] No event provided")
+        return
+
+    # dj-stripe processes the event inside a transaction; if that rolls back Stripe will
+    # redeliver, so only hand the event to the worker once it is actually stored
+    transaction.on_commit(
+        lambda: async_task(
+            "core.tasks.process_stripe_subscription_event",
+            event.id,
+            event.type,
+            event.data,
+            group="Stripe Webhook",
+        )
+    )
+
+
+@djstripe_receiver("customer.subscription.created")
+def handle_created_subscription(**kwargs):
+    enqueue_subscription_event(kwargs.get("event"))
+
+
+@djstripe_receiver("customer.subscription.updated")
+def handle_updated_subscription(**kwargs):
+    enqueue_subscription_event(kwargs.get("event"))
+
+
+@djstripe_receiver("customer.subscription.deleted")
+def handle_deleted_subscription(**kwargs):
+    enqueue_subscription_event(kwargs.get("event"))
+
+
 @djstripe_receiver("checkout.session.completed")
 def handle_checkout_completed(**kwargs):
     """
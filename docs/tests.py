@@ -1,3 +1,4 @@
+import os
 import re
 from pathlib import Path
 from unittest.mock import patch
@@ -12,6 +13,7 @@ from docs.views import (
     get_flat_page_list,
     get_previous_and_next_pages,
     load_navigation_config,
+    render_docs_markdown,
 )
 
 
@@ -58,6 +60,21 @@ navigation:
     }
 
 
+def test_load_navigation_config_picks_up_edits_to_navigation_yaml(tmp_path):
+    navigation_file = tmp_path / "docs" / "navigation.yaml"
+    navigation_file.parent.mkdir(parents=True, exist_ok=True)
+    navigation_file.write_text("navigation:\n  features:\n    - first\n", encoding="utf-8")
+
+    with override_settings(BASE_DIR=tmp_path):
+        assert load_navigation_config() == {"features": ["first"]}
+
+        navigation_file.write_text("navigation:\n  features:\n    - second\n", encoding="utf-8")
+        modified_time = navigation_file.stat().st_mtime + 1
+        os.utime(navigation_file, (modified_time, modified_time))
+
+        assert load_navigation_config() == {"features": ["second"]}
+
+
 def test_get_docs_navigation_respects_custom_order_and_includes_remaining_items(tmp_path):
     create_markdown_file(
         tmp_path / "docs" / "content" / "getting-started" / "quickstart.md",
@@ -228,6 +245,14 @@ navigation:
     assert "<h1>Welcome</h1>" in captured_context["content"]
 
 
+def test_render_docs_markdown_resets_state_between_documents():
+    first_html = render_docs_markdown("# First\n\n| a | b |\n|---|---|\n| 1 | 2 |")
+    second_html = render_docs_markdown("# Second")
+
+    assert "<table>" in first_html
+    assert second_html == "<h1>Second</h1>"
+
+
 def test_docs_page_view_raises_404_for_missing_file(tmp_path, request_factory):
     request = request_factory.get("/docs/missing/page/")
 
@@ -1,12 +1,18 @@
+import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import frontmatter
 import markdown
 import yaml
 from django.conf import settings
+from django.core.cache import cache
 from django.http import Http404
 from django.shortcuts import render
 
+DOCS_PAGE_CACHE_TIMEOUT = 60 * 60
+
 
 def load_navigation_config():
     """
@@ -18,6 +24,12 @@ def load_navigation_config():
     if not navigation_file.exists():
         return {}
 
+    return _parse_navigation_file(navigation_file, navigation_file.stat().st_mtime)
+
+
+@lru_cache(maxsize=8)
+def _parse_navigation_file(navigation_file, modified_time):
+    # modified_time is only part of the cache key, so edits to the file are picked up
     try:
         with open(navigation_file, encoding="utf-8") as file:
             config = yaml.safe_load(file)
@@ -26,23 +38,49 @@ def load_navigation_config():
         return {}
 
 
-def get_docs_navigation():  # noqa: C901
+def get_docs_version():
+    """
+    Return a hashable key that changes whenever docs pages or navigation.yaml change.
+    Returns None if the docs/content directory doesn't exist.
+    """
+    content_dir = Path(settings.BASE_DIR) / "docs" / "content"
+
+    if not content_dir.exists():
+        return None
+
+    # Directory mtimes change when pages are added, removed or renamed
+    with os.scandir(content_dir) as entries:
+        content_version = tuple(
+            sorted((entry.name, entry.stat().st_mtime) for entry in entries if entry.is_dir())
+        )
+    navigation_file = content_dir.parent / "navigation.yaml"
+    navigation_version = navigation_file.stat().st_mtime if navigation_file.exists() else None
+
+    return content_dir, content_version, navigation_version
+
+
+def get_docs_navigation(docs_version=None):
     """
     Build navigation structure from the docs/content directory.
     Uses custom ordering from navigation.yaml if defined, otherwise uses alphabetical order.
     Returns a list of dicts with category names and their pages.
     """
-    content_dir = Path(settings.BASE_DIR) / "docs" / "content"
-    navigation = []
+    if docs_version is None:
+        docs_version = get_docs_version()
 
-    if not content_dir.exists():
-        return navigation
+    if docs_version is None:
+        return []
 
-    all_categories = {}
-    for category_dir in content_dir.iterdir():
-        if category_dir.is_dir():
-            category_slug = category_dir.name
-            all_categories[category_slug] = category_dir
+    return _build_docs_navigation(*docs_version)
+
+
+@lru_cache(maxsize=8)
+def _build_docs_navigation(content_dir, content_version, navigation_version):  # noqa: C901
+    navigation = []
+
+    all_categories = {
+        category_slug: content_dir / category_slug for category_slug, _ in content_version
+    }
 
     navigation_config = load_navigation_config()
 
@@ -59,9 +97,11 @@ def get_docs_navigation():  # noqa: C901
         category_name = category_slug.replace("-", " ").title()
 
         all_pages = {}
-        for markdown_file in category_dir.glob("*.md"):
-            page_slug = markdown_file.stem
-            all_pages[page_slug] = markdown_file
+        with os.scandir(category_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    page_slug = entry.name[: -len(".md")]
+                    all_pages[page_slug] = category_dir / entry.name
 
         custom_page_order = navigation_config.get(category_slug, [])
 
@@ -115,22 +155,31 @@ def get_flat_page_list(navigation):
     return flat_pages
 
 
-def get_previous_and_next_pages(navigation, current_category, current_page):
+def _index_flat_pages(navigation):
+    flat_pages = get_flat_page_list(navigation)
+    page_positions = {}
+    for index, page_item in enumerate(flat_pages):
+        page_positions.setdefault((page_item["category_slug"], page_item["page_slug"]), index)
+    return flat_pages, page_positions
+
+
+@lru_cache(maxsize=8)
+def _get_indexed_docs_pages(docs_version):
+    return _index_flat_pages(get_docs_navigation(docs_version))
+
+
+def get_previous_and_next_pages(navigation, current_category, current_page, docs_version=None):
     """
     Find the previous and next pages in the documentation navigation.
+    Pass the docs_version the navigation was built from to reuse its cached page index.
     Returns a tuple of (previous_page, next_page) where each is a dict or None.
     """
-    flat_pages = get_flat_page_list(navigation)
-
-    current_index = None
-    for index, page_item in enumerate(flat_pages):
-        if (
-            page_item["category_slug"] == current_category
-            and page_item["page_slug"] == current_page
-        ):
-            current_index = index
-            break
+    if docs_version is None:
+        flat_pages, page_positions = _index_flat_pages(navigation)
+    else:
+        flat_pages, page_positions = _get_indexed_docs_pages(docs_version)
 
+    current_index = page_positions.get((current_category, current_page))
     if current_index is None:
         return None, None
 
@@ -140,6 +189,35 @@ def get_previous_and_next_pages(navigation, current_category, current_page):
     return previous_page, next_page
 
 
+# Markdown instances keep per-document state, so each thread reuses its own
+_markdown_renderers = threading.local()
+
+
+def render_docs_markdown(content):
+    """Convert docs markdown to HTML without rebuilding the extension pipeline each call."""
+    renderer = getattr(_markdown_renderers, "renderer", None)
+    if renderer is None:
+        renderer = markdown.Markdown(extensions=["fenced_code", "tables", "codehilite"])
+        _markdown_renderers.renderer = renderer
+
+    return renderer.reset().convert(content)
+
+
+def get_rendered_docs_page(markdown_file, category, page):
+    """
+    Return the page's rendered HTML and front matter, cached until the file changes.
+    """
+    cache_key = f"docs_page:{category}:{page}:{markdown_file.stat().st_mtime_ns}"
+    rendered_page = cache.get(cache_key)
+
+    if rendered_page is None:
+        post = frontmatter.loads(markdown_file.read_text(encoding="utf-8"))
+        rendered_page = (render_docs_markdown(post.content), post.metadata)
+        cache.set(cache_key, rendered_page, timeout=DOCS_PAGE_CACHE_TIMEOUT)
+
+    return rendered_page
+
+
 def docs_page_view(request, category, page):
     """
     Render a documentation page from markdown file with frontmatter support.
@@ -151,16 +229,14 @@ def docs_page_view(request, category, page):
         raise Http404("Documentation page not found")
 
     try:
-        with open(markdown_file, encoding="utf-8") as file:
-            post = frontmatter.load(file)
+        markdown_html, front_matter = get_rendered_docs_page(markdown_file, category, page)
 
-        markdown_html = markdown.markdown(
-            post.content, extensions=["fenced_code", "tables", "codehilite"]
+        docs_version = get_docs_version()
+        navigation = get_docs_navigation(docs_version)
+        previous_page, next_page = get_previous_and_next_pages(
+            navigation, category, page, docs_version=docs_version
         )
 
-        navigation = get_docs_navigation()
-        previous_page, next_page = get_previous_and_next_pages(navigation, category, page)
-
         default_page_title = page.replace("-", " ").title()
         default_category_title = category.replace("-", " ").title()
 
@@ -169,12 +245,12 @@ def docs_page_view(request, category, page):
             "navigation": navigation,
             "current_category": category,
             "current_page": page,
-            "page_title": post.get("title", default_page_title),
+            "page_title": front_matter.get("title", default_page_title),
             "category_title": default_category_title,
-            "meta_description": post.get("description", ""),
-            "meta_keywords": post.get("keywords", ""),
-            "author": post.get("author", ""),
-            "canonical_url": post.get("canonical_url", ""),
+            "meta_description": front_matter.get("description", ""),
+            "meta_keywords": front_matter.get("keywords", ""),
+            "author": front_matter.get("author", ""),
+            "canonical_url": front_matter.get("canonical_url", ""),
             "previous_page": previous_page,
             "next_page": next_page,
         }
@@ -110,6 +110,8 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "tuxseo.urls"
 
+# No explicit "loaders": Django already wraps the default loaders in the cached
+# loader, so compiled templates (including the PDF export) are reused per process
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -339,6 +341,26 @@ REDIS_PASSWORD = env("REDIS_PASSWORD", default="")
 REDIS_DB = env("REDIS_DB", default="0")
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Values that django-q workers write or invalidate and web processes read (rendered
+    # PDFs, keyword and subscriber caches) must not live in a per-process cache, so this
+    # alias is Redis in every environment
+    "shared": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    },
+}
+if ENVIRONMENT == "prod":
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    }
+
+SITEMAP_CACHE_TIMEOUT = env.int("DJANGO_SITEMAP_CACHE_TIMEOUT", default=60 * 60 * 24)
+
 Q_CLUSTER = {
     "name": "tuxseo-q",
     "timeout": 3600,  # 1 hour
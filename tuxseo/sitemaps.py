@@ -1,9 +1,42 @@
+from collections import namedtuple
+from functools import cache, lru_cache
+
 from django.contrib import sitemaps
 from django.contrib.sitemaps import GenericSitemap
 from django.urls import reverse
 
 from core.models import BlogPost
-from docs.views import get_docs_navigation
+from docs.views import get_docs_navigation, get_docs_version
+
+DocSitemapItem = namedtuple("DocSitemapItem", "category page url")
+
+_STATIC_VIEW_NAMES = (
+    "landing",
+    "home",
+    "uses",
+    "pricing",
+    "blog_posts",
+    "changelog",
+)
+
+
+@cache
+def _reverse_static_view(url_name):
+    # The URLconf only changes on restart, so each name needs resolving once per process
+    return reverse(url_name)
+
+
+@lru_cache(maxsize=8)
+def _build_doc_sitemap_items(docs_version):
+    return [
+        DocSitemapItem(
+            category_info["category_slug"],
+            page_info["slug"],
+            f"/docs/{category_info['category_slug']}/{page_info['slug']}/",
+        )
+        for category_info in get_docs_navigation(docs_version)
+        for page_info in category_info["pages"]
+    ]
 
 
 class StaticViewSitemap(sitemaps.Sitemap):
@@ -16,16 +49,9 @@ class StaticViewSitemap(sitemaps.Sitemap):
         """Identify items that will be in the Sitemap
 
         Returns:
-            List: urlNames that will be in the Sitemap
+            Tuple: urlNames that will be in the Sitemap
         """
-        return [
-            "landing",
-            "home",
-            "uses",
-            "pricing",
-            "blog_posts",
-            "changelog",
-        ]
+        return _STATIC_VIEW_NAMES
 
     def location(self, item):
         """Get location for each item in the Sitemap
@@ -36,7 +62,7 @@ class StaticViewSitemap(sitemaps.Sitemap):
         Returns:
             str: Url for the sitemap item
         """
-        return reverse(item)
+        return _reverse_static_view(item)
 
 
 class DocsSitemap(sitemaps.Sitemap):
@@ -50,40 +76,34 @@ class DocsSitemap(sitemaps.Sitemap):
         """Get all documentation pages from the navigation structure
 
         Returns:
-            List: List of dicts with category and page slugs for each doc page
+            List: DocSitemapItem tuples with category and page slugs and the URL for each page
         """
-        doc_pages = []
-        navigation = get_docs_navigation()
-
-        for category_info in navigation:
-            category_slug = category_info["category_slug"]
-            for page_info in category_info["pages"]:
-                page_slug = page_info["slug"]
-                doc_pages.append(
-                    {
-                        "category": category_slug,
-                        "page": page_slug,
-                    }
-                )
-
-        return doc_pages
+        docs_version = get_docs_version()
+        if docs_version is None:
+            return []
+
+        return _build_doc_sitemap_items(docs_version)
 
     def location(self, item):
         """Get location for each doc page in the Sitemap
 
         Args:
-            item (dict): Dictionary with category and page slugs
+            item (DocSitemapItem): Category and page slugs and the page URL
 
         Returns:
             str: URL for the sitemap item
         """
-        return f"/docs/{item['category']}/{item['page']}/"
+        return item.url
 
 
 sitemaps = {
     "static": StaticViewSitemap,
     "blog": GenericSitemap(
-        {"queryset": BlogPost.objects.all(), "date_field": "created_at"},
+        {
+            # get_absolute_url only needs the slug, and lastmod comes from created_at
+            "queryset": BlogPost.objects.only("slug", "created_at").order_by("-created_at"),
+            "date_field": "created_at",
+        },
         priority=0.85,
         protocol="https",
     ),
@@ -16,9 +16,11 @@ Including another URLconf
 
 from functools import partial
 
+from django.conf import settings
 from django.contrib import admin
 from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path, re_path
+from django.views.decorators.cache import cache_page
 from django.views.generic import TemplateView
 from django.views.generic.base import RedirectView
 from ninja.openapi.views import openapi_json, openapi_view
@@ -77,7 +79,7 @@ urlpatterns = [
     path("", include("steering.urls")),
     path(
         "sitemap.xml",
-        sitemap,
+        cache_page(settings.SITEMAP_CACHE_TIMEOUT)(sitemap),
         {"sitemaps": sitemaps},
         name="django.contrib.sitemaps.views.sitemap",
     ),